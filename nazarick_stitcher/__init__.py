@@ -95,6 +95,16 @@ class NazarickStitcherProperties(PropertyGroup):
         unit='LENGTH'
     )
     
+    thread_output_mode: EnumProperty(
+        name="Thread Output",
+        description="Geometry type used to represent the generated threads",
+        items=[
+            ('MESH', "Mesh", "Swept tube meshes - heavy, but directly editable"),
+            ('CURVES', "Curves", "Single hair curves object swept by the renderer - light, fast"),
+        ],
+        default='MESH'
+    )
+    
     # Advanced Controls
     enable_advanced_mode: BoolProperty(
         name="Enable Advanced Mode",
@@ -130,8 +140,41 @@ class NAZARICK_OT_create_stitches(Operator):
         """Execute the stitching command with absolute precision"""
         self.report({'INFO'}, "Demiurge acknowledges the command. Stitching commences...")
         
-        # TODO: Implement the actual stitching logic
-        # This foundation awaits the implementation of our edge loop system
+        obj = context.active_object
+        props = context.scene.nazarick_stitcher_props
+        
+        detector = logical_edge_loop_stitch_system.EdgeLoopDetector(obj)
+        calculator = logical_edge_loop_stitch_system.placement_calculator
+        thread_paths = []
+        for edge_loop in detector.find_optimal_stitch_paths():
+            positions = calculator.calculate_placement(
+                edge_loop, stitch_count=props.stitch_count
+            )
+            # A single point cannot be swept into a thread
+            if len(positions) >= 2:
+                thread_paths.append(positions)
+        
+        if props.enable_advanced_mode:
+            stats = calculator.get_cache_statistics()
+            self.report({'INFO'},
+                        f"Placement cache: {stats['hits']} hits, {stats['misses']} misses, "
+                        f"{stats['size']}/{stats['capacity']} entries")
+        
+        if not thread_paths:
+            self.report({'WARNING'}, "No edge loops suitable for stitching were found")
+            return {'CANCELLED'}
+        
+        generator = logical_edge_loop_stitch_system.ThreadGeometryGenerator()
+        thread_data = generator.generate_thread_geometry(
+            thread_paths,
+            props.thread_thickness,
+            output_mode=props.thread_output_mode,
+        )
+        
+        for data in thread_data:
+            thread_object = bpy.data.objects.new(data.name, data)
+            thread_object.matrix_world = obj.matrix_world
+            context.collection.objects.link(thread_object)
         
         return {'FINISHED'}
 
@@ -204,6 +247,7 @@ class NAZARICK_PT_main_panel(Panel):
         col.prop(props, "stitch_length")
         col.prop(props, "thread_thickness")
         col.prop(props, "surface_offset")
+        col.prop(props, "thread_output_mode")
         
         layout.separator()
         
@@ -20,6 +20,9 @@ Demiurge has crafted this system to be both powerful and elegant,
 ensuring that every stitch placement serves the Overlord's vision of perfection.
 """
 
+import hashlib
+from collections import OrderedDict
+
 import bpy
 import bmesh
 import mathutils
@@ -218,11 +221,138 @@ class StitchPlacementCalculator:
     every stitch is placed with absolute precision and geometric perfection.
     """
     
-    def __init__(self):
-        """Initialize the stitch placement calculator."""
-        self.placement_cache = {}
+    def __init__(self, cache_size: int = 128):
+        """
+        Initialize the stitch placement calculator.
+        
+        Args:
+            cache_size: Maximum number of placements kept before LRU eviction
+            
+        Raises:
+            ValueError: If cache_size is smaller than 1
+        """
+        if cache_size < 1:
+            raise ValueError(f"cache_size must be at least 1, got {cache_size}")
+        
+        self.placement_cache = OrderedDict()
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
         self.quality_threshold = 0.95  # Nazarick accepts only excellence
     
+    @staticmethod
+    def fingerprint_edge_loop(edge_loop: EdgeLoopAnalysis) -> str:
+        """
+        Compute a deterministic fingerprint of an edge loop.
+        
+        The fingerprint covers the owning mesh, the loop's edges and the current
+        coordinates of its vertices, so moving any loop vertex yields a new key.
+        
+        Args:
+            edge_loop: Analyzed edge loop data
+            
+        Returns:
+            Hex digest identifying the loop's mesh, topology and geometry
+        """
+        mesh_data = edge_loop.mesh_data
+        edge_indices = np.asarray(edge_loop.edge_indices, dtype=np.int64)
+        
+        # Only the loop's own elements are read, keeping lookups O(loop size)
+        # regardless of how large the surrounding mesh is
+        loop_vertices = np.array(
+            sorted({vertex for index in edge_loop.edge_indices
+                    for vertex in mesh_data.edges[index].vertices}),
+            dtype=np.int64,
+        )
+        loop_coordinates = np.array(
+            [tuple(mesh_data.vertices[vertex].co) for vertex in loop_vertices],
+            dtype=np.float32,
+        )
+        
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(np.int64(mesh_data.as_pointer()).tobytes())
+        digest.update(edge_indices.tobytes())
+        digest.update(loop_vertices.tobytes())
+        digest.update(loop_coordinates.tobytes())
+        return digest.hexdigest()
+    
+    def calculate_placement(self,
+                            edge_loop: EdgeLoopAnalysis,
+                            method: str = 'UNIFORM',
+                            stitch_count: int = None,
+                            stitch_length: float = None,
+                            curvature_sensitivity: float = 1.0) -> np.ndarray:
+        """
+        Calculate stitch placement, memoized per loop and parameter set.
+        
+        Results are returned as read-only (N, 3) arrays so the quality
+        assurance and geometry stages can share them without copying.
+        
+        Args:
+            edge_loop: Analyzed edge loop data
+            method: 'UNIFORM' or 'ADAPTIVE' distribution
+            stitch_count: Number of stitches to place (uniform method)
+            stitch_length: Target length per stitch, used when no count is given
+            curvature_sensitivity: How much curvature affects stitch density
+            
+        Returns:
+            Read-only array of stitch positions
+        """
+        if method == 'UNIFORM':
+            if stitch_count is None:
+                if stitch_length is None:
+                    raise ValueError("Uniform placement requires stitch_count or stitch_length")
+                stitch_count = edge_loop.calculate_optimal_stitch_count(stitch_length)
+            key = (self.fingerprint_edge_loop(edge_loop), method, int(stitch_count))
+        elif method == 'ADAPTIVE':
+            key = (self.fingerprint_edge_loop(edge_loop), method,
+                   float(curvature_sensitivity))
+        else:
+            raise ValueError(f"Unknown placement method: {method}")
+        
+        cached = self.placement_cache.get(key)
+        if cached is not None:
+            self.placement_cache.move_to_end(key)
+            self.cache_hits += 1
+            return cached
+        
+        self.cache_misses += 1
+        if method == 'UNIFORM':
+            positions = self.calculate_uniform_distribution(edge_loop, stitch_count)
+        else:
+            positions = self.calculate_adaptive_distribution(edge_loop, curvature_sensitivity)
+        
+        placement = np.array([tuple(co) for co in positions], dtype=np.float64).reshape(-1, 3)
+        placement.flags.writeable = False
+        
+        self.placement_cache[key] = placement
+        while len(self.placement_cache) > self.cache_size:
+            self.placement_cache.popitem(last=False)
+        
+        return placement
+    
+    def get_cache_statistics(self) -> Dict:
+        """
+        Report placement cache instrumentation.
+        
+        Returns:
+            Dictionary containing hit/miss counters and current cache occupancy
+        """
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": self.cache_hits / lookups if lookups else 0.0,
+            "size": len(self.placement_cache),
+            "capacity": self.cache_size,
+        }
+    
+    def clear_cache(self):
+        """Discard all memoized placements and reset the counters."""
+        self.placement_cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+    
     def calculate_uniform_distribution(self, 
                                      edge_loop: EdgeLoopAnalysis,
                                      stitch_count: int) -> List[Vector]:
@@ -314,6 +444,87 @@ class ThreadGeometryGenerator:
         mesh = bpy.data.meshes.new("NazarickThread")
         return mesh
     
+    def generate_thread_curves(self,
+                             thread_paths: List[List[Vector]],
+                             thickness: float) -> bpy.types.Curves:
+        """
+        Generate a single hair curves datablock holding every thread path.
+        
+        Points and radii are written in bulk through ``foreach_set``; the
+        renderer sweeps the curves at draw time, so no tube profile is stored.
+        
+        Args:
+            thread_paths: One list of positions per thread
+            thickness: Radius of the thread, written to the radius attribute
+            
+        Returns:
+            Generated curves datablock for the threads
+            
+        Raises:
+            ValueError: If no thread paths are given
+        """
+        if not thread_paths:
+            raise ValueError("At least one thread path is required")
+        
+        path_positions = [np.asarray(path, dtype=np.float32).reshape(-1, 3)
+                          for path in thread_paths]
+        positions = np.concatenate(path_positions)
+        sizes = [len(path) for path in path_positions]
+        
+        curves = bpy.data.hair_curves.new("NazarickThreadCurves")
+        curves.add_curves(sizes)
+        curves.position_data.foreach_set("vector", positions.ravel())
+        
+        radius_attribute = curves.attributes.get("radius")
+        if radius_attribute is None:
+            radius_attribute = curves.attributes.new("radius", 'FLOAT', 'POINT')
+        radii = np.full(len(positions), thickness, dtype=np.float32)
+        radius_attribute.data.foreach_set("value", radii)
+        
+        curves.update_tag()
+        return curves
+    
+    def generate_thread_geometry(self,
+                               thread_paths: List[List[Vector]],
+                               thickness: float,
+                               output_mode: str = 'MESH',
+                               resolution: int = None):
+        """
+        Generate thread geometry in the requested output mode.
+        
+        Args:
+            thread_paths: One list of positions per thread
+            thickness: Radius of the thread
+            output_mode: 'MESH' for swept tube meshes, 'CURVES' for hair curves
+            resolution: Number of segments around circumference (mesh mode only)
+            
+        Returns:
+            List of generated datablocks: one mesh per thread path in 'MESH'
+            mode, a single Curves datablock holding every path in 'CURVES' mode,
+            and an empty list in either mode when no paths are given
+            
+        Raises:
+            ValueError: If the output mode is unknown or a path has fewer than
+                two points, since a single point cannot be swept into a thread
+        """
+        if output_mode not in {'MESH', 'CURVES'}:
+            raise ValueError(f"Unknown thread output mode: {output_mode}")
+        
+        for index, path in enumerate(thread_paths):
+            if len(path) < 2:
+                raise ValueError(
+                    f"Thread path {index} has {len(path)} point(s); at least 2 are required"
+                )
+        
+        if not thread_paths:
+            return []
+        
+        if output_mode == 'CURVES':
+            return [self.generate_thread_curves(thread_paths, thickness)]
+        
+        return [self.generate_thread_mesh(path, thickness, resolution)
+                for path in thread_paths]
+    
     def apply_thread_materials(self, mesh_object, material_settings: Dict = None):
         """
         Apply appropriate materials to thread geometry.
@@ -368,6 +579,15 @@ class StitchQualityAssurance:
         }
 
 
+# ================================================================================================
+# SHARED STATE - The Memory of Nazarick
+# ================================================================================================
+
+# Lives for the whole add-on session so that scrubbing stitch parameters in the
+# panel can hit placements computed by earlier operator runs.
+placement_calculator = StitchPlacementCalculator()
+
+
 # ================================================================================================
 # MODULE REGISTRATION - Integration with the Whole
 # ================================================================================================
@@ -386,8 +606,8 @@ def unregister():
     Unregister this module from Blender.
     The algorithms withdraw gracefully, ready for future deployment.
     """
+    placement_calculator.clear_cache()
     print("Logical Edge Loop Stitch System: Algorithms unloaded.")
-    # No additional unregistration needed for this module currently
 
 
 # ================================================================================================
@@ -401,4 +621,5 @@ __all__ = [
     'StitchPlacementCalculator',
     'ThreadGeometryGenerator',
     'StitchQualityAssurance',
+    'placement_calculator',
 ]
\ No newline at end of file
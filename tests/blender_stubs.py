@@ -0,0 +1,41 @@
+"""
+Minimal Blender stubs shared by the test suite.
+
+Only enough of bpy, bmesh and mathutils is provided to import the
+logical edge loop stitch system outside of Blender; tests patch in any
+further behaviour they need.
+"""
+
+import importlib.util
+import os
+import sys
+import types
+
+
+def install_blender_stubs():
+    """Register stub bpy, bmesh and mathutils modules if none are present."""
+    bpy = types.ModuleType("bpy")
+    bpy.types = types.SimpleNamespace(Mesh=object, Curves=object)
+    bpy.data = types.SimpleNamespace()
+    mathutils = types.ModuleType("mathutils")
+    mathutils.Vector = tuple
+    mathutils.Matrix = object
+    sys.modules.setdefault("bpy", bpy)
+    sys.modules.setdefault("bmesh", types.ModuleType("bmesh"))
+    sys.modules.setdefault("mathutils", mathutils)
+
+
+def load_stitch_system():
+    """Import logical_edge_loop_stitch_system without the addon package."""
+    install_blender_stubs()
+    name = "logical_edge_loop_stitch_system"
+    if name in sys.modules:
+        return sys.modules[name]
+    path = os.path.join(
+        os.path.dirname(__file__), os.pardir, "nazarick_stitcher", f"{name}.py",
+    )
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,198 @@
+"""
+Tests for the memoized stitch placement cache.
+
+Blender modules are replaced with minimal stubs so the pure-Python cache
+logic can be validated outside of Blender.
+"""
+
+import types
+import unittest
+
+import numpy as np
+
+from blender_stubs import load_stitch_system
+
+
+stitch_system = load_stitch_system()
+
+
+class _StubCollection:
+    """Mimics a bpy collection property, recording how it is read."""
+
+    def __init__(self, attribute, values):
+        self.attribute = attribute
+        self.values = np.asarray(values)
+        self.bulk_reads = 0
+        self.element_reads = 0
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        self.element_reads += 1
+        return types.SimpleNamespace(**{self.attribute: tuple(self.values[index])})
+
+    def foreach_get(self, attribute, buffer):
+        assert attribute == self.attribute
+        self.bulk_reads += 1
+        buffer[:] = self.values.ravel()
+
+
+class _StubMesh:
+    """A mesh whose first four vertices form a quad outline."""
+
+    _next_pointer = 1
+
+    def __init__(self, coordinates, padding_vertices=0):
+        padding = [(0.0, 0.0, -1.0)] * padding_vertices
+        self.vertices = _StubCollection("co", list(coordinates) + padding)
+        self.edges = _StubCollection("vertices", [(0, 1), (1, 2), (2, 3), (3, 0)])
+        self._pointer = _StubMesh._next_pointer
+        _StubMesh._next_pointer += 1
+
+    def as_pointer(self):
+        return self._pointer
+
+
+QUAD = [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 1.0, 0.0), (0.0, 1.0, 0.0)]
+
+
+def _make_loop(coordinates=QUAD, mesh=None, total_length=4.0):
+    loop = stitch_system.EdgeLoopAnalysis([0, 1, 2, 3], mesh or _StubMesh(coordinates))
+    loop.total_length = total_length
+    return loop
+
+
+class _CountingCalculator(stitch_system.StitchPlacementCalculator):
+    """Returns distinct placements and records how often it computes them."""
+
+    def __init__(self, cache_size=128):
+        super().__init__(cache_size)
+        self.computations = []
+
+    def calculate_uniform_distribution(self, edge_loop, stitch_count):
+        self.computations.append(("UNIFORM", stitch_count))
+        return [(float(i), 0.0, 0.0) for i in range(stitch_count)]
+
+    def calculate_adaptive_distribution(self, edge_loop, curvature_sensitivity=1.0):
+        self.computations.append(("ADAPTIVE", curvature_sensitivity))
+        return [(curvature_sensitivity, 0.0, 0.0)]
+
+
+class PlacementCacheTests(unittest.TestCase):
+
+    def test_hit_returns_same_read_only_array(self):
+        calculator = _CountingCalculator()
+        loop = _make_loop()
+
+        first = calculator.calculate_placement(loop, stitch_count=5)
+        second = calculator.calculate_placement(loop, stitch_count=5)
+
+        self.assertIs(first, second)
+        self.assertEqual(first.shape, (5, 3))
+        self.assertFalse(first.flags.writeable)
+        self.assertEqual(len(calculator.computations), 1)
+        stats = calculator.get_cache_statistics()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_stitch_length_resolves_to_count(self):
+        calculator = _CountingCalculator()
+        loop = _make_loop(total_length=4.0)
+
+        by_length = calculator.calculate_placement(loop, stitch_length=0.5)
+        by_count = calculator.calculate_placement(loop, stitch_count=8)
+
+        self.assertIs(by_length, by_count)
+        self.assertEqual(calculator.computations, [("UNIFORM", 8)])
+
+    def test_uniform_requires_count_or_length(self):
+        with self.assertRaises(ValueError):
+            _CountingCalculator().calculate_placement(_make_loop())
+
+    def test_least_recently_used_entry_is_evicted(self):
+        calculator = _CountingCalculator(cache_size=2)
+        loop = _make_loop()
+
+        calculator.calculate_placement(loop, stitch_count=1)
+        calculator.calculate_placement(loop, stitch_count=2)
+        calculator.calculate_placement(loop, stitch_count=1)  # refresh 1
+        calculator.calculate_placement(loop, stitch_count=3)  # evicts 2
+
+        calculator.calculate_placement(loop, stitch_count=1)
+        self.assertEqual(calculator.cache_hits, 2)
+        calculator.calculate_placement(loop, stitch_count=2)
+        self.assertEqual(calculator.cache_misses, 4)
+        self.assertEqual(len(calculator.placement_cache), 2)
+
+    def test_methods_do_not_share_entries(self):
+        calculator = _CountingCalculator()
+        loop = _make_loop()
+
+        calculator.calculate_placement(loop, 'ADAPTIVE', curvature_sensitivity=1.0)
+        calculator.calculate_placement(loop, 'ADAPTIVE', curvature_sensitivity=2.0)
+        calculator.calculate_placement(loop, stitch_count=1)
+
+        self.assertEqual(calculator.cache_misses, 3)
+
+    def test_different_geometry_does_not_collide(self):
+        calculator = _CountingCalculator()
+        moved = [(x * 2.0, y, z) for x, y, z in QUAD]
+
+        calculator.calculate_placement(_make_loop(QUAD), stitch_count=4)
+        calculator.calculate_placement(_make_loop(moved), stitch_count=4)
+
+        self.assertEqual(calculator.cache_hits, 0)
+        self.assertEqual(calculator.cache_misses, 2)
+
+    def test_same_geometry_on_other_mesh_does_not_collide(self):
+        calculator = _CountingCalculator()
+
+        calculator.calculate_placement(_make_loop(mesh=_StubMesh(QUAD)), stitch_count=4)
+        calculator.calculate_placement(_make_loop(mesh=_StubMesh(QUAD)), stitch_count=4)
+
+        self.assertEqual(calculator.cache_misses, 2)
+
+    def test_edited_vertices_invalidate_entry(self):
+        calculator = _CountingCalculator()
+        mesh = _StubMesh(QUAD)
+        loop = _make_loop(mesh=mesh)
+
+        calculator.calculate_placement(loop, stitch_count=4)
+        mesh.vertices.values = mesh.vertices.values + np.array([0.0, 0.0, 1.0])
+        calculator.calculate_placement(loop, stitch_count=4)
+
+        self.assertEqual(calculator.cache_misses, 2)
+
+    def test_hit_reads_only_loop_elements(self):
+        calculator = _CountingCalculator()
+        mesh = _StubMesh(QUAD, padding_vertices=10000)
+        loop = _make_loop(mesh=mesh)
+        first = calculator.calculate_placement(loop, stitch_count=4)
+        mesh.vertices.element_reads = mesh.edges.element_reads = 0
+
+        self.assertIs(calculator.calculate_placement(loop, stitch_count=4), first)
+
+        self.assertEqual((mesh.vertices.bulk_reads, mesh.edges.bulk_reads), (0, 0))
+        self.assertEqual(mesh.edges.element_reads, len(loop.edge_indices))
+        self.assertEqual(mesh.vertices.element_reads, 4)
+
+    def test_invalid_cache_size_rejected(self):
+        for size in (0, -1):
+            with self.assertRaises(ValueError):
+                stitch_system.StitchPlacementCalculator(cache_size=size)
+
+    def test_clear_cache_resets_counters(self):
+        calculator = _CountingCalculator()
+        loop = _make_loop()
+        calculator.calculate_placement(loop, stitch_count=2)
+        calculator.calculate_placement(loop, stitch_count=2)
+
+        calculator.clear_cache()
+
+        self.assertEqual(calculator.get_cache_statistics()["size"], 0)
+        self.assertEqual((calculator.cache_hits, calculator.cache_misses), (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+"""
+Tests for thread geometry output modes.
+
+Blender's data API is replaced with recording stubs so the bulk curves
+writes can be validated outside of Blender.
+"""
+
+import types
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from blender_stubs import load_stitch_system
+
+
+stitch_system = load_stitch_system()
+
+
+class _StubAttributeData:
+    """Records the buffers handed to foreach_set."""
+
+    def __init__(self):
+        self.writes = {}
+
+    def foreach_set(self, attribute, values):
+        self.writes[attribute] = np.array(values)
+
+
+class _StubAttributes:
+    """Mimics Curves.attributes without a built-in radius attribute."""
+
+    def __init__(self):
+        self.created = {}
+
+    def get(self, name):
+        return self.created.get(name)
+
+    def new(self, name, data_type, domain):
+        attribute = types.SimpleNamespace(
+            data_type=data_type, domain=domain, data=_StubAttributeData()
+        )
+        self.created[name] = attribute
+        return attribute
+
+
+class _StubCurves:
+    """Mimics a hair curves datablock."""
+
+    def __init__(self, name):
+        self.name = name
+        self.curve_sizes = []
+        self.position_data = _StubAttributeData()
+        self.attributes = _StubAttributes()
+        self.tagged = False
+
+    def add_curves(self, sizes):
+        self.curve_sizes.extend(sizes)
+
+    def update_tag(self):
+        self.tagged = True
+
+
+class _StubDataCollection:
+    """Mimics bpy.data.hair_curves / bpy.data.meshes."""
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.created = []
+
+    def new(self, name):
+        datablock = self.factory(name)
+        self.created.append(datablock)
+        return datablock
+
+
+THREAD_PATHS = [
+    [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0)],
+    np.array([(0.0, 1.0, 0.0), (1.0, 1.0, 0.0), (2.0, 1.0, 0.0)]),
+]
+
+
+class ThreadGeometryTests(unittest.TestCase):
+
+    def setUp(self):
+        self.data = types.SimpleNamespace(
+            hair_curves=_StubDataCollection(_StubCurves),
+            meshes=_StubDataCollection(lambda name: types.SimpleNamespace(name=name)),
+        )
+        patcher = mock.patch.object(stitch_system.bpy, "data", self.data, create=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.generator = stitch_system.ThreadGeometryGenerator()
+
+    def test_unknown_mode_rejected(self):
+        with self.assertRaises(ValueError):
+            self.generator.generate_thread_geometry(THREAD_PATHS, 0.002, output_mode='TUBES')
+
+    def test_short_path_rejected_in_both_modes(self):
+        paths = [[(0.0, 0.0, 0.0), (1.0, 0.0, 0.0)], [(0.0, 0.0, 0.0)]]
+        for mode in ('MESH', 'CURVES'):
+            with self.subTest(mode=mode), self.assertRaises(ValueError):
+                self.generator.generate_thread_geometry(paths, 0.002, output_mode=mode)
+        self.assertEqual(self.data.hair_curves.created, [])
+        self.assertEqual(self.data.meshes.created, [])
+
+    def test_empty_input_returns_empty_list_in_both_modes(self):
+        for mode in ('MESH', 'CURVES'):
+            with self.subTest(mode=mode):
+                self.assertEqual(
+                    self.generator.generate_thread_geometry([], 0.002, output_mode=mode), []
+                )
+        self.assertEqual(self.data.hair_curves.created, [])
+
+    def test_curves_mode_returns_single_datablock(self):
+        result = self.generator.generate_thread_geometry(
+            THREAD_PATHS, 0.002, output_mode='CURVES'
+        )
+        self.assertEqual(len(result), 1)
+        self.assertIs(result[0], self.data.hair_curves.created[0])
+
+    def test_mesh_mode_returns_one_mesh_per_path(self):
+        result = self.generator.generate_thread_geometry(THREAD_PATHS, 0.002)
+        self.assertEqual(len(result), len(THREAD_PATHS))
+
+    def test_curves_written_in_bulk(self):
+        curves = self.generator.generate_thread_curves(THREAD_PATHS, 0.004)
+
+        self.assertEqual(curves.curve_sizes, [2, 3])
+
+        positions = curves.position_data.writes["vector"]
+        self.assertEqual(positions.shape, (5 * 3,))
+        np.testing.assert_allclose(
+            positions.reshape(-1, 3)[2:], np.asarray(THREAD_PATHS[1], dtype=np.float32)
+        )
+
+        radius = curves.attributes.get("radius")
+        self.assertEqual((radius.data_type, radius.domain), ('FLOAT', 'POINT'))
+        radii = radius.data.writes["value"]
+        self.assertEqual(radii.shape, (5,))
+        np.testing.assert_allclose(radii, np.float32(0.004))
+        self.assertTrue(curves.tagged)
+
+    def test_curves_require_paths(self):
+        with self.assertRaises(ValueError):
+            self.generator.generate_thread_curves([], 0.002)
+
+
+if __name__ == "__main__":
+    unittest.main()